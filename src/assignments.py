@@ -1,14 +1,14 @@
 from datetime import datetime
 from typing import List, Optional
+from zoneinfo import ZoneInfo
 
 from dateutil import parser
-from pytz import timezone
 
 from src.errors import ConfigurationError
 from src.sheets import Sheet
 from src.utils import cast_bool, cast_date, cast_list_str
 
-PST = timezone("US/Pacific")
+PST = ZoneInfo("America/Los_Angeles")
 
 
 class Assignment:
@@ -43,7 +43,7 @@ class Assignment:
 
         request_time: datetime = parser.parse(request_time)
         if request_time.tzinfo is None:
-            request_time = PST.localize(request_time)
+            request_time = request_time.replace(tzinfo=PST)
         if request_time > self.due_date:
             return True
         else:
@@ -1,10 +1,31 @@
-from typing import List
-
-from gradescope_api.client import GradescopeClient
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Any, Dict, List, Optional
 
 from src.errors import GradescopeError
+from src.http import use_shared_pool
 from src.utils import Environment, cast_bool, truncate
 
+# Kept small so that we don't trip Gradescope's rate limits.
+MAX_CONCURRENT_EXTENSIONS = 4
+
+# Extensions that fail with one of these (e.g. rate limiting or a Gradescope outage) are retried with exponential
+# backoff; anything else (e.g. an unknown student) fails immediately.
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_EXTENSION_ATTEMPTS = 4
+
+
+def is_transient_error(err: Exception) -> bool:
+    # Connection failures and timeouts are already retried by the shared HTTP adapter (see src/http.py), so only
+    # status codes are considered here. requests' HTTPError carries the status on its response; other errors may carry
+    # it directly.
+    status_code = getattr(err, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(err, "response", None), "status_code", None)
+    return status_code in RETRYABLE_STATUS_CODES
+
 
 class Gradescope:
     """
@@ -16,28 +37,84 @@ class Gradescope:
         email = Environment.get("GRADESCOPE_EMAIL")
         password = Environment.get("GRADESCOPE_PASSWORD")
 
+        # Imported here rather than at module load, since most deployments never enable Gradescope extensions.
+        from gradescope_api.client import GradescopeClient
+
         try:
             self.client = GradescopeClient(email=email, password=password)
         except Exception as err:
             raise GradescopeError(f"Failed to sign into Gradescope: {err}")
 
+        # Keep connections to Gradescope alive across requests, so that extending several assignments doesn't pay for
+        # a fresh TCP/TLS handshake on every call.
+        use_shared_pool(self.client.session)
+
+        # Courses keyed by their root URL (e.g. https://www.gradescope.com/courses/12345), so assignments in the same
+        # course share a single course lookup.
+        self._course_cache: Dict[str, Any] = {}
+
     @staticmethod
     def is_enabled():
         return cast_bool(Environment.safe_get("EXTEND_GRADESCOPE_ASSIGNMENTS", "No"))
 
+    @staticmethod
+    def get_course_key(assignment_url: str) -> str:
+        match = re.match(r"(.*/courses/\d+)", assignment_url)
+        return match.group(1) if match else assignment_url
+
+    def get_course(self, assignment_url: str) -> Any:
+        course_key = Gradescope.get_course_key(assignment_url)
+        if course_key not in self._course_cache:
+            self._course_cache[course_key] = self.client.get_course(course_url=assignment_url)
+        return self._course_cache[course_key]
+
     def apply_extension(self, assignment_urls: List[str], email: str, num_days: int) -> List[str]:
         warnings = []
-        for assignment_url in assignment_urls:
-            prefix = f"[{email}] [{assignment_url}] [{num_days}] "
-            print("Extending: " + prefix)
+        # Resolve each course once. If that fails, none of its assignments can be extended, so skip straight to the
+        # next course.
+        sorted_urls = sorted(assignment_urls, key=Gradescope.get_course_key)
+        for _, course_urls in groupby(sorted_urls, key=Gradescope.get_course_key):
+            course_urls = list(course_urls)
             try:
-                course = self.client.get_course(course_url=assignment_url)
-                assignment = course.get_assignment(assignment_url=assignment_url)
-                assignment.apply_extension(email=email, num_days=num_days)
+                course = self.get_course(assignment_url=course_urls[0])
             except Exception as err:
                 print("GradescopeAPIError: " + str(err))
-                warnings.append(
-                    prefix
-                    + f"failed to extend assignment in Gradescope: internal Gradescope error occurred ({truncate(err)})"
+                for assignment_url in course_urls:
+                    warnings.append(
+                        f"[{email}] [{assignment_url}] [{num_days}] "
+                        + f"failed to extend assignment in Gradescope: could not load course ({truncate(err)})"
+                    )
+                continue
+
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_EXTENSIONS) as executor:
+                results = executor.map(
+                    lambda assignment_url: self._apply_one(course, assignment_url, email, num_days), course_urls
                 )
+                warnings.extend([warning for warning in results if warning])
         return warnings
+
+    def _apply_one(self, course: Any, assignment_url: str, email: str, num_days: int) -> Optional[str]:
+        prefix = f"[{email}] [{assignment_url}] [{num_days}] "
+        print("Extending: " + prefix)
+        try:
+            self._apply_extension_with_retry(course, assignment_url, email, num_days)
+            return None
+        except Exception as err:
+            print("GradescopeAPIError: " + str(err))
+            return (
+                prefix
+                + f"failed to extend assignment in Gradescope: internal Gradescope error occurred ({truncate(err)})"
+            )
+
+    def _apply_extension_with_retry(self, course: Any, assignment_url: str, email: str, num_days: int) -> None:
+        for attempt in range(MAX_EXTENSION_ATTEMPTS):
+            try:
+                assignment = course.get_assignment(assignment_url=assignment_url)
+                assignment.apply_extension(email=email, num_days=num_days)
+                return
+            except Exception as err:
+                if attempt == MAX_EXTENSION_ATTEMPTS - 1 or not is_transient_error(err):
+                    raise
+                delay = min(0.5 * 2**attempt, 10)
+                print(f"Transient Gradescope error, retrying in {delay}s: {err}")
+                time.sleep(delay)
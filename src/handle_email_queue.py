@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from src.assignments import AssignmentList
 from src.email import Email
@@ -31,6 +31,9 @@ def handle_email_queue(request_json):
 
     slack = SlackManager()
 
+    # Signed into lazily (and only once), the first time a queued student needs their extensions applied.
+    gradescope: Optional[Gradescope] = None
+
     for i, table_record in enumerate(sheet_records.get_all_records()):
         student = StudentRecord(table_index=i, table_record=table_record, sheet=sheet_records)
         if student.email_status() == EMAIL_STATUS_IN_QUEUE:
@@ -51,8 +54,9 @@ def handle_email_queue(request_json):
                 )
 
             if Gradescope.is_enabled():
-                client = Gradescope()
-                warnings = student.apply_extensions(assignments=assignments, gradescope=client)
+                if gradescope is None:
+                    gradescope = Gradescope()
+                warnings = student.apply_extensions(assignments=assignments, gradescope=gradescope)
                 for warning in warnings:
                     slack.add_warning(warning)
 
@@ -0,0 +1,16 @@
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# A single adapter (and so a single pool of keep-alive connections) shared by every requests session in this process.
+# Sessions still keep their own cookies and auth; only the underlying connections are shared.
+ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=20, max_retries=Retry(total=3, backoff_factor=0.3))
+
+
+def use_shared_pool(session: Session) -> Session:
+    """
+    Routes a session's HTTPS traffic through the shared connection pool.
+    """
+    session.mount("https://", ADAPTER)
+    session.headers["Connection"] = "keep-alive"
+    return session
@@ -1,11 +1,11 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.assignments import AssignmentList
+from src.assignments import Assignment, AssignmentList
 from src.email import Email
 from src.gradescope import Gradescope
 from src.record import StudentRecord
 from src.sheets import Sheet
-from src.slack import SlackManager
+from src.slack import NoopSlackManager, SlackManager
 from src.submission import FormSubmission
 from src.utils import Environment
 
@@ -28,9 +28,11 @@ class Policy:
         )
 
         self.slack = slack
+        self.gradescope: Optional[Gradescope] = None
 
     def fetch_student_records(self, sheet_records: Sheet):
         # Validate/extract student (and partner, if applicable) records
+        self.sheet_records = sheet_records
         self.student = StudentRecord.from_email(email=self.submission.get_email(), sheet_records=sheet_records)
         self.partners: List[StudentRecord] = []
         if self.submission.has_partner():
@@ -44,7 +46,10 @@ class Policy:
 
     def apply(self, silent: bool = False) -> bool:
         if silent:
+            # Suppress the caller's SlackManager too, in case they use it after this run; this run itself only talks
+            # to a no-op manager, so nothing is formatted for Slack at all.
             self.slack.suppress()
+            self.slack = NoopSlackManager()
 
         reason = (
             self.submission.get_reason() if self.submission.knows_assignments() else self.submission.get_game_plan()
@@ -110,11 +115,10 @@ class Policy:
         # Case (1): Submission contains partner, and student's status is a "work-in-progress".
         # We can't auto-approve here for either party (we're blocked on the student).
         if self.submission.has_partner() and self.student.has_wip_status():
-            self.student.flush()
             for partner in self.partners:
                 partner.set_status_pending()
                 partner.set_log(f"Work-in-progress for form submitter [submitter: {self.student.get_email()}].")
-                partner.flush()
+            self._flush_all(self.student, *self.partners)
             work_in_progress = (
                 "An extension request needs review (there is work-in-progress for this student's record)."
             )
@@ -125,8 +129,6 @@ class Policy:
 
             # Dirty partners are partners with work-in-progress rows (e.g. we want to leave them as is).
             dirty_partners = [partner for partner in self.partners if partner.has_wip_status()]
-            for partner in dirty_partners:
-                partner.flush()
 
             # Construct a log message that describes what happened in this case.
             wip_emails = ", ".join([p.get_email() for p in dirty_partners])
@@ -140,12 +142,11 @@ class Policy:
             for partner in clean_partners:
                 partner.set_status_pending()
                 partner.set_log(msg)
-                partner.flush()
 
             # We want to flip the student's row to yellow.
             self.student.set_status_pending()
             self.student.set_log(msg)
-            self.student.flush()
+            self._flush_all(self.student, *self.partners)
             work_in_progress = (
                 "An extension request needs review (there is work-in-progress for this student's partner)."
             )
@@ -162,14 +163,54 @@ class Policy:
         return work_in_progress
 
     def process_submission(self) -> Optional[str]:
+        needs_human, writes = self._classify_requests()
+
+        for assignment, num_days in writes:
+            # Regardless of whether or not this needs a human, we write the number of days requested back onto the
+            # roster sheet. Note that this write isn't pushed until we call flush().
+            self.student.queue_write_back(col_key=assignment.get_id(), col_value=num_days)
+
+            # We do the same for the partner, if this assignment has a partner and the submission has a partner.
+            if assignment.is_partner_assignment() and self.partners:
+                for partner in self.partners:
+                    partner.queue_write_back(col_key=assignment.get_id(), col_value=num_days)
+
+        # If this request needs a human, we update statuses to "pending" and proceed.
+        if needs_human:
+            self.student.set_status_pending()
+            self.student.set_log(
+                f"{needs_human.capitalize()} [submitter: {self.student.get_email()}]"
+                if self.partners
+                else needs_human.capitalize()
+            )
+            for partner in self.partners:
+                partner.set_status_pending()
+                partner.set_log(f"{needs_human.capitalize()} [submitter: {self.student.get_email()}]")
+            self._flush_all(self.student, *self.partners)
+
+        return needs_human
+
+    def _classify_requests(self) -> Tuple[Optional[str], List[Tuple[Assignment, int]]]:
+        """
+        Walks through each extension request in this submission, and returns the first reason (if any) that the
+        submission needs a human to review it, along with the number of days to record for each requested assignment.
+        """
         needs_human = None
+        writes: List[Tuple[Assignment, int]] = []
+
+        # These don't change from one requested assignment to the next, so read them once up front.
+        claims_dsp = self.submission.claims_dsp()
+        auto_approve_threshold = Environment.get_auto_approve_threshold()
+        auto_approve_threshold_dsp = Environment.get_auto_approve_threshold_dsp()
+        auto_approve_assignment_threshold = Environment.get_auto_approve_assignment_threshold()
+        max_total_requested_extensions = Environment.get_max_total_requested_extensions_threshold()
 
         # Check to see if the student requested a bunch of extensions all within this request.
         num_requests = self.submission.get_num_requests()
-        if not self.submission.claims_dsp() and num_requests > Environment.get_auto_approve_assignment_threshold():
+        if not claims_dsp and num_requests > auto_approve_assignment_threshold:
             needs_human = (
                 f"this student has requested more assignment extensions ({num_requests}) than the "
-                + f"auto-approve threshold ({Environment.get_auto_approve_assignment_threshold()})"
+                + f"auto-approve threshold ({auto_approve_assignment_threshold})"
             )
 
         total_num_extensions = self.student.count_requests(assignments=self.assignments) + num_requests
@@ -189,18 +230,24 @@ class Policy:
                 )
                 num_days = existing_request
 
+            writes.append((assignment, num_days))
+
+            # Once we know this request needs a human, there's no need to keep checking thresholds.
+            if needs_human:
+                continue
+
             # Flag Case #1: The number of requested days is too large (non-DSP).
-            if not self.submission.claims_dsp() and num_days > Environment.get_auto_approve_threshold():
-                if Environment.get_auto_approve_threshold() <= 0:
+            if not claims_dsp and num_days > auto_approve_threshold:
+                if auto_approve_threshold <= 0:
                     needs_human = "auto-approve is disabled"
                 else:
                     needs_human = (
                         f"a request of {num_days} days is greater than auto-approve threshold "
-                        + f"of {Environment.get_auto_approve_threshold()} days"
+                        + f"of {auto_approve_threshold} days"
                     )
 
             # Flag Case #2: The number of requested days is too large (DSP).
-            elif self.submission.claims_dsp() and num_days > Environment.get_auto_approve_threshold_dsp():
+            elif claims_dsp and num_days > auto_approve_threshold_dsp:
                 needs_human = f"a DSP request of {num_days} days is greater than DSP auto-approve threshold"
 
             # Flag Case #3: This extension request is retroactive (the due date is in the past).
@@ -209,9 +256,9 @@ class Policy:
 
             # Flag Case #4: The student has requested an extension on too many assignments (non-DSP).
             elif (
-                not self.submission.claims_dsp()
-                and Environment.get_max_total_requested_extensions_threshold() != -1
-                and total_num_extensions > Environment.get_max_total_requested_extensions_threshold()
+                not claims_dsp
+                and max_total_requested_extensions != -1
+                and total_num_extensions > max_total_requested_extensions
             ):
                 needs_human = (
                     f"a student requested extensions on more assignments ({total_num_extensions} total)"
@@ -219,33 +266,7 @@ class Policy:
                 )
                 print(needs_human)
 
-            print(Environment.get_max_total_requested_extensions_threshold(), total_num_extensions)
-
-            # Regardless of whether or not this needs a human, we write the number of days requested back onto the
-            # roster sheet. Note that this write isn't pushed until we call flush().
-            self.student.queue_write_back(col_key=assignment.get_id(), col_value=num_days)
-
-            # We do the same for the partner, if this assignment has a partner and the submission has a partner.
-            if assignment.is_partner_assignment() and self.partners:
-                for partner in self.partners:
-                    partner.queue_write_back(col_key=assignment.get_id(), col_value=num_days)
-
-        # If this request needs a human, we update statuses to "pending" and proceed.
-        if needs_human:
-            self.student.set_status_pending()
-            self.student.set_log(
-                f"{needs_human.capitalize()} [submitter: {self.student.get_email()}]"
-                if self.partners
-                else needs_human.capitalize()
-            )
-            self.student.flush()
-            if self.partners:
-                for partner in self.partners:
-                    partner.set_status_pending()
-                    partner.set_log(f"{needs_human.capitalize()} [submitter: {self.student.get_email()}]")
-                    partner.flush()
-
-        return needs_human
+        return needs_human, writes
 
     def check_for_warnings(self):
         if self.submission.claims_dsp() and (self.student.roster_contains_dsp_status() and not self.student.is_dsp()):
@@ -258,7 +279,6 @@ class Policy:
     def approve(self):
         self.student.set_status_approved()
         self.student.set_log("Auto-approved.")
-        self.student.flush()
 
         if not self.partners:
             message = "An extension request was automatically approved!"
@@ -266,11 +286,27 @@ class Policy:
             for partner in self.partners:
                 partner.set_status_approved()
                 partner.set_log(f"Auto-approved [request source: {self.student.get_email()}].")
-                partner.flush()
             message = "An extension request was automatically approved (for the submitter's partner(s), too!)"
 
+        self._flush_all(self.student, *self.partners)
         return message
 
+    def _flush_all(self, *records: StudentRecord):
+        """
+        Flushes several student records at once. Writes to existing roster rows are sent in a single request; rows that
+        don't exist yet still need to be appended one at a time.
+        """
+        updates = []
+        for record in records:
+            if record.table_index == -1:
+                record.flush()
+            elif record.write_queue:
+                updates.append(record.get_pending_row_update())
+
+        self.sheet_records.batch_update_rows(updates=updates)
+        for record in records:
+            record.mark_flushed()
+
     def send_email(self, target: StudentRecord):
         try:
             email = Email.from_student_record(student=target, assignments=self.assignments)
@@ -286,7 +322,9 @@ class Policy:
 
     def extend_assignments(self, target: StudentRecord):
         if Gradescope.is_enabled():
-            client = Gradescope()
-            warnings = target.apply_extensions(assignments=self.assignments, gradescope=client)
+            # Sign in once, and share the client (and its connection pool) between the student and their partners.
+            if not self.gradescope:
+                self.gradescope = Gradescope()
+            warnings = target.apply_extensions(assignments=self.assignments, gradescope=self.gradescope)
             for warning in warnings:
                 self.slack.add_warning(warning)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
 from dateutil.parser import parse
-from pytz import timezone
 
 from src.assignments import AssignmentList
 from src.errors import StudentRecordError
@@ -20,7 +20,10 @@ EMAIL_STATUS_PENDING = "Pending Approval"
 EMAIL_STATUS_IN_QUEUE = "In Queue"
 EMAIL_STATUS_AUTO_SENT = "Auto Sent"
 
-PST = timezone("US/Pacific")
+# Approval statuses that mean a human is already working on this record.
+WIP_STATUSES = frozenset({APPROVAL_STATUS_REQUESTED_MEETING, APPROVAL_STATUS_PENDING})
+
+PST = ZoneInfo("America/Los_Angeles")
 
 
 class StudentRecord:
@@ -33,13 +36,12 @@ class StudentRecord:
         self.table_record = table_record
         self.table_index = table_index
         self.sheet = sheet
-        self.write_queue = {}
+        # Keyed by column, so repeated writes to the same column coalesce into the last value written.
+        self.write_queue: Dict[str, Any] = {}
+        self.request_cache: Dict[str, Optional[int]] = {}
 
     def has_wip_status(self):
-        return (
-            self.approval_status() == APPROVAL_STATUS_REQUESTED_MEETING
-            or self.approval_status() == APPROVAL_STATUS_PENDING
-        )
+        return self.approval_status() in WIP_STATUSES
 
     def get_email(self):
         return self.table_record["email"].lower()
@@ -99,60 +101,92 @@ class StudentRecord:
             self.queue_write_back(col_key="flush_gradescope", col_value=False)
 
     def count_requests(self, assignments=AssignmentList):
-        count = 0
-        for assignment_id in assignments.get_all_ids():
-            if self.get_request(assignment_id=assignment_id) is not None:
-                count += 1
-        return count
+        return sum(1 for assignment_id in assignments.get_all_ids() if self._has_request(assignment_id))
+
+    def _has_request(self, assignment_id: str) -> bool:
+        # A cheaper check than get_request for when we only care whether a cell is filled in (no int parsing).
+        return str(self.table_record.get(assignment_id, "")).strip() != ""
 
     def get_request(self, assignment_id: str) -> Optional[int]:
-        try:
-            result = str(self.table_record[assignment_id])
-            result = result.strip()
-            if len(result) > 0:
-                return int(result)
+        if assignment_id not in self.request_cache:
+            self.request_cache[assignment_id] = self._parse_request(assignment_id)
+        return self.request_cache[assignment_id]
+
+    def _parse_request(self, assignment_id: str) -> Optional[int]:
+        if assignment_id not in self.table_record:
+            raise self._request_error(assignment_id, KeyError(assignment_id))
+        value = self.table_record[assignment_id]
+
+        # The Sheets API hands back numeric cells as numbers, and queued write-backs are ints, so skip the string
+        # round-trip when we can.
+        if type(value) is int:
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+
+        result = value.strip() if isinstance(value, str) else str(value).strip()
+        if not result:
             return None
-        except Exception as err:
-            raise StudentRecordError(
-                f"An error occurred while fetching assignment with ID {assignment_id}.\n"
-                + f"Table Record: {self.table_record}\n"
-                + f"Table Index: {self.table_index}\n"
-                + f"Error: {err}"
-            )
+        try:
+            return int(result)
+        except ValueError as err:
+            raise self._request_error(assignment_id, err)
+
+    def _request_error(self, assignment_id: str, err: Exception) -> StudentRecordError:
+        return StudentRecordError(
+            f"An error occurred while fetching assignment with ID {assignment_id}.\n"
+            + f"Table Record: {self.table_record}\n"
+            + f"Table Index: {self.table_index}\n"
+            + f"Error: {err}"
+        )
 
     def queue_write_back(self, col_key: str, col_value: Any) -> Optional[str]:
         self.write_queue[col_key] = col_value
+        self.request_cache.pop(col_key, None)
 
     def set_last_run_timestamp(self, timestamp: str):
         if "last_run_timestamp" in self.sheet.get_headers():
             timestamp: datetime = parse(timestamp)
             if not timestamp.tzinfo:
-                timestamp = PST.localize(timestamp)
+                timestamp = timestamp.replace(tzinfo=PST)
             self.queue_write_back(
                 col_key="last_run_timestamp", col_value=str(timestamp.strftime("%-m/%-d/%Y %H:%M:%S"))
             )
 
+    def get_pending_cells(self) -> List[List[Any]]:
+        """
+        Returns this record's queued writes as [row_index, col_index, value] cells, in the format Sheet.update_cells
+        expects. Only meaningful for records that already have a row on the sheet.
+        """
+        return [[self.table_index, self.sheet.get_header_index(col), value] for col, value in self.write_queue.items()]
+
+    def get_pending_row_update(self) -> Tuple[int, Dict[int, Any]]:
+        """
+        Returns this record's queued writes as a (row_index, {col_index: value}) pair, in the format
+        Sheet.batch_update_rows expects. Only meaningful for records that already have a row on the sheet.
+        """
+        return (self.table_index, {col_index: value for _, col_index, value in self.get_pending_cells()})
+
+    def mark_flushed(self):
+        # Update local table_record object for email.
+        for col, value in self.write_queue.items():
+            self.table_record[col] = value
+            self.request_cache.pop(col, None)
+
+        # These writes have been sent, so don't send them again on a subsequent flush.
+        self.write_queue = {}
+
     def flush(self):
-        headers = self.sheet.get_headers()
+        if not self.write_queue:
+            return
 
         if self.table_index == -1:
-            values = [self.write_queue.get(header) for header in headers]
+            values = [self.write_queue.get(header) for header in self.sheet.get_headers()]
             self.sheet.append_row(values=values, value_input_option="USER_ENTERED")
-
-            # Update local table_record object for email.
-            for col, value in self.write_queue.items():
-                self.table_record[col] = value
-
         else:
-            cells = []
-            for col, value in self.write_queue.items():
-                row_index = self.table_index
-                col_index = headers.index(col)
-                cells.append([row_index, col_index, value])
-
-                # Update local table_record object for email.
-                self.table_record[col] = value
-            self.sheet.update_cells(cells=cells)
+            self.sheet.update_cells(cells=self.get_pending_cells())
+
+        self.mark_flushed()
 
     def apply_extensions(self, assignments: AssignmentList, gradescope: Gradescope) -> List[str]:
         warnings = []
@@ -2,9 +2,11 @@ import os
 from typing import Any, Dict, List, Optional, Tuple
 
 import gspread
+from gspread.utils import absolute_range_name, rowcol_to_a1
 from gspread.worksheet import Worksheet
 
 from src.errors import SheetError
+from src.http import use_shared_pool
 
 SHEET_STUDENT_RECORDS = "Roster"
 SHEET_ASSIGNMENTS = "Assignments"
@@ -22,22 +24,45 @@ class Sheet:
         self.all_values = self.sheet.get_all_values()
         self.all_records = self.sheet.get_all_records()
         self.headers = self.all_values[0]
+        self.header_index: Dict[str, int] = {}
+        for i, header in enumerate(self.headers):
+            # Keep the first column with a given header, as headers.index would.
+            self.header_index.setdefault(header, i)
+
+        # Lazily built lookups of {column: {lowercased value: row index}}, used by get_record_by_id.
+        self.row_index: Dict[str, Dict[str, int]] = {}
 
     def get_headers(self) -> List[str]:
         return self.headers
 
+    def get_header_index(self, header: str) -> int:
+        """
+        Returns the data-relative column index of a header (the first column is index 0).
+        """
+        if header not in self.header_index:
+            raise SheetError(f"Column not found in sheet: {header}")
+        return self.header_index[header]
+
     def get_all_values(self) -> List[List[Any]]:
         return self.all_values
 
     def get_all_records(self) -> List[Dict[str, Any]]:
         return self.all_records
 
+    def get_row_index_by(self, id_column: str, id_value: str) -> Optional[int]:
+        if id_column not in self.row_index:
+            index: Dict[str, int] = {}
+            for i, record in enumerate(self.get_all_records()):
+                # Keep the first matching row, as a top-to-bottom scan would.
+                index.setdefault(str(record.get(id_column)).lower(), i)
+            self.row_index[id_column] = index
+        return self.row_index[id_column].get(str(id_value).lower())
+
     def get_record_by_id(self, id_column: str, id_value: str) -> Optional[Tuple[int, Dict[str, Any]]]:
-        all_records = self.get_all_records()
-        for i, record in enumerate(all_records):
-            if str(record.get(id_column)).lower() == str(id_value).lower():
-                return (i, record)
-        return None
+        i = self.get_row_index_by(id_column=id_column, id_value=id_value)
+        if i is None:
+            return None
+        return (i, self.get_all_records()[i])
 
     def update_cells(self, cells: List[Any]):
         gspread_cells: List[gspread.Cell] = []
@@ -46,6 +71,29 @@ class Sheet:
         if len(gspread_cells) > 0:
             self.sheet.update_cells(gspread_cells, value_input_option="USER_ENTERED")
 
+    def batch_update_rows(self, updates: List[Tuple[int, Dict[int, Any]]]):
+        """
+        Writes to several rows in a single request. Each update is a data-relative row_index (see update_cell) and a
+        map of data-relative col_index to value. Each row is sent as its own range, so rows far apart on the sheet
+        don't inflate the request the way a single update_cells rectangle would.
+        """
+        data = []
+        for row_index, values in updates:
+            if not values:
+                continue
+            first_col, last_col = min(values), max(values)
+            start = rowcol_to_a1(row_index + 2, first_col + 1)
+            end = rowcol_to_a1(row_index + 2, last_col + 1)
+            data.append(
+                {
+                    "range": absolute_range_name(self.sheet.title, f"{start}:{end}"),
+                    # Columns in between that aren't being written are sent as None, which the API leaves untouched.
+                    "values": [[values.get(col) for col in range(first_col, last_col + 1)]],
+                }
+            )
+        if len(data) > 0:
+            self.sheet.spreadsheet.values_batch_update(body={"valueInputOption": "USER_ENTERED", "data": data})
+
     def update_cell(self, row_index: int, col_index: int, value: Any) -> Dict[str, Any]:
         """
         Note: pass in data-relative row_index and col_index here. This method offsets row_index by two,
@@ -58,6 +106,7 @@ class Sheet:
 
     def append_row(self, values: List[Any], value_input_option: str):
         self.sheet.append_row(values=values, value_input_option=value_input_option)
+        self.row_index = {}
 
 
 class BaseSpreadsheet:
@@ -70,7 +119,9 @@ class BaseSpreadsheet:
             raise SheetError("Could not find Google Service Account at service-account.json.")
 
         self.spreadsheet_url = spreadsheet_url
-        self.spreadsheet = gspread.service_account("service-account.json").open_by_url(spreadsheet_url)
+        client = gspread.service_account("service-account.json")
+        use_shared_pool(client.session)
+        self.spreadsheet = client.open_by_url(spreadsheet_url)
 
     def get_sheet(self, sheet_name: str) -> Sheet:
         return Sheet(sheet=self.spreadsheet.worksheet(sheet_name))
@@ -16,15 +16,19 @@ class SlackManager:
     """
 
     def __init__(self) -> None:
-        self.webhooks: List[WebhookClient] = []
+        self._init_state()
         self.webhooks.append(WebhookClient(Environment.get("SLACK_ENDPOINT")))
-        self.warnings = []
-        self.silent = False
 
         if Environment.contains("SLACK_ENDPOINT_DEBUG"):
             if Environment.get("SLACK_ENDPOINT_DEBUG") != Environment.get("SLACK_ENDPOINT"):
                 self.webhooks.append(WebhookClient(Environment.get("SLACK_ENDPOINT_DEBUG")))
 
+    def _init_state(self) -> None:
+        # Shared with NoopSlackManager, which needs the same fields but no webhooks.
+        self.webhooks: List[WebhookClient] = []
+        self.warnings = []
+        self.silent = False
+
     def suppress(self):
         self.silent = True
 
@@ -146,3 +150,25 @@ class SlackManager:
     def check_error(self, response: WebhookResponse):
         if response.status_code != 200:
             raise SlackError(f"Status code not 200: {vars(response)}")
+
+
+class NoopSlackManager(SlackManager):
+    """
+    A SlackManager that drops everything, for silent runs. Nothing is formatted, printed, or posted.
+    """
+
+    def __init__(self) -> None:
+        self._init_state()
+        self.silent = True
+
+    def add_warning(self, warning: str):
+        pass
+
+    def send_message(self, message: str) -> None:
+        pass
+
+    def send_student_update(self, message: str, autoapprove: bool = False) -> None:
+        pass
+
+    def send_error(self, error: str) -> None:
+        pass
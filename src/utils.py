@@ -1,15 +1,15 @@
 import os
 from datetime import datetime
 from typing import Any, List, Optional
+from zoneinfo import ZoneInfo
 
 from dateutil import parser
 from dotenv import dotenv_values
-from pytz import timezone
 
 from src.errors import ConfigurationError, KnownError
 from src.sheets import Sheet
 
-PST = timezone("US/Pacific")
+PST = ZoneInfo("America/Los_Angeles")
 
 
 def cast_bool(cell: str) -> bool:
@@ -30,7 +30,10 @@ def cast_date(cell: str, deadline: bool = True, optional: bool = False) -> Optio
             return None
         cell = str(cell).strip()
         suffix = " 11:59 PM" if deadline else ""
-        return PST.localize(parser.parse(str(cell) + suffix))
+        date = parser.parse(str(cell) + suffix)
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=PST)
+        return date
     except Exception as err:
         raise KnownError(f"Could not convert cell to date format. Value = {cell}, Error = {err}.")
 
@@ -31,6 +31,9 @@ class MockSheet:
     def get_headers(self) -> List[str]:
         return list(self.df.columns)
 
+    def get_header_index(self, header: str) -> int:
+        return self.df.columns.get_loc(header)
+
     def get_all_values(self) -> List[List[Any]]:
         return [list(self.df.columns)] + self.df.values.tolist()
 
@@ -53,6 +56,11 @@ class MockSheet:
         self.df = self.df.fillna("")
         self.modified = True
 
+    def batch_update_rows(self, updates: List[Tuple[int, Dict[int, Any]]]):
+        self.update_cells(
+            [(row_index, col_index, value) for row_index, values in updates for col_index, value in values.items()]
+        )
+
     def flush(self):
         if not self.modified:
             return
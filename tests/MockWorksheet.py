@@ -0,0 +1,36 @@
+from typing import Any, Dict, List
+
+
+class MockSpreadsheet:
+    """
+    A minimal stand-in for a gspread Spreadsheet, which records batch updates instead of sending them.
+    """
+
+    def __init__(self) -> None:
+        self.batch_updates: List[Dict[str, Any]] = []
+
+    def values_batch_update(self, body: Dict[str, Any]):
+        self.batch_updates.append(body)
+
+
+class MockWorksheet:
+    """
+    A minimal stand-in for a gspread Worksheet, so Sheet can be exercised without network access.
+    """
+
+    def __init__(self, values: List[List[Any]], title: str = "Roster") -> None:
+        self.values = values
+        self.title = title
+        self.spreadsheet = MockSpreadsheet()
+        self.appended_rows: List[List[Any]] = []
+
+    def get_all_values(self) -> List[List[Any]]:
+        return self.values
+
+    def get_all_records(self):
+        headers = self.values[0]
+        return [dict(zip(headers, row)) for row in self.values[1:]]
+
+    def append_row(self, values: List[Any], value_input_option: str):
+        self.values.append(values)
+        self.appended_rows.append(values)
@@ -1,4 +1,45 @@
-from src.gradescope import Gradescope
+from collections import Counter
+from typing import List
+
+import requests
+
+from src.gradescope import Gradescope, is_transient_error
+
+
+class MockAssignment:
+    def __init__(self, assignment_url: str, extended: List[str]) -> None:
+        self.assignment_url = assignment_url
+        self.extended = extended
+
+    def apply_extension(self, email: str, num_days: int):
+        if "fail" in self.assignment_url:
+            raise Exception("student not found")
+        self.extended.append(self.assignment_url)
+
+
+class MockCourse:
+    def __init__(self, extended: List[str]) -> None:
+        self.extended = extended
+
+    def get_assignment(self, assignment_url: str) -> MockAssignment:
+        return MockAssignment(assignment_url=assignment_url, extended=self.extended)
+
+
+class MockClient:
+    """
+    A stand-in for GradescopeClient that counts course lookups and records which assignments were extended.
+    """
+
+    def __init__(self) -> None:
+        self.course_lookups = Counter()
+        self.extended: List[str] = []
+
+    def get_course(self, course_url: str) -> MockCourse:
+        course_key = Gradescope.get_course_key(course_url)
+        self.course_lookups[course_key] += 1
+        if "/courses/" not in course_key:
+            raise Exception("invalid course URL")
+        return MockCourse(extended=self.extended)
 
 
 class TestGradescope:
@@ -36,3 +77,74 @@ class TestGradescope:
             num_days=3,
         )
         assert len(warnings) > 0
+
+    def test_apply_extension_offline(self):
+        # Skip Gradescope.__init__, which signs in; apply_extension only needs a client and an empty course cache.
+        gradescope = Gradescope.__new__(Gradescope)
+        gradescope.client = MockClient()
+        gradescope._course_cache = {}
+
+        course_a = "https://www.gradescope.com/courses/1"
+        course_b = "https://www.gradescope.com/courses/2"
+        warnings = gradescope.apply_extension(
+            assignment_urls=[
+                course_a + "/assignments/10",
+                course_b + "/assignments/20",
+                course_a + "/assignments/11",
+                course_b + "/assignments/fail",
+                "hello world",
+            ],
+            email="student@berkeley.edu",
+            num_days=2,
+        )
+
+        # Each course is looked up exactly once, no matter how many of its assignments were requested.
+        assert gradescope.client.course_lookups == {course_a: 1, course_b: 1, "hello world": 1}
+
+        # Every assignment in a course that loaded was extended, except the one that failed.
+        assert sorted(gradescope.client.extended) == [
+            course_a + "/assignments/10",
+            course_a + "/assignments/11",
+            course_b + "/assignments/20",
+        ]
+
+        # Warnings come back only for the failing assignment and the URL whose course couldn't be loaded.
+        assert len(warnings) == 2
+        assert any(f"[{course_b}/assignments/fail]" in warning for warning in warnings)
+        assert any("[hello world]" in warning for warning in warnings)
+
+    def test_apply_extension_mixed_urls(self):
+        # An invalid URL shouldn't stop a valid URL from being extended, and only the invalid URL should be warned on.
+        warnings = Gradescope().apply_extension(
+            assignment_urls=[
+                "hello world",
+                "https://www.gradescope.com/courses/56746/assignments/942482/review_grades",
+            ],
+            email="shomil+cs161test@berkeley.edu",
+            num_days=1,
+        )
+        assert len(warnings) == 1
+        assert "[hello world]" in warnings[0]
+
+    def test_get_course_key(self):
+        assert (
+            Gradescope.get_course_key("https://www.gradescope.com/courses/56746/assignments/942482/review_grades")
+            == "https://www.gradescope.com/courses/56746"
+        )
+        assert Gradescope.get_course_key("https://www.gradescope.com/courses/56746") == (
+            "https://www.gradescope.com/courses/56746"
+        )
+        assert Gradescope.get_course_key("hello world") == "hello world"
+
+    def test_is_transient_error(self):
+        def http_error(status_code: int) -> requests.HTTPError:
+            response = requests.Response()
+            response.status_code = status_code
+            return requests.HTTPError(response=response)
+
+        # Connection failures are retried by the HTTP adapter, not by apply_extension.
+        assert not is_transient_error(requests.ConnectionError())
+        assert is_transient_error(http_error(429))
+        assert is_transient_error(http_error(503))
+        assert not is_transient_error(http_error(404))
+        assert not is_transient_error(Exception("unknown student"))
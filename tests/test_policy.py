@@ -0,0 +1,52 @@
+from src.policy import Policy
+from src.record import StudentRecord
+from src.sheets import Sheet
+
+from tests.MockWorksheet import MockWorksheet
+
+
+class TestPolicy:
+    def test_flush_all(self):
+        worksheet = MockWorksheet(
+            [
+                ["email", "approval_status", "hw1"],
+                ["a@berkeley.edu", "", ""],
+                ["b@berkeley.edu", "", ""],
+            ]
+        )
+        sheet = Sheet(sheet=worksheet)
+
+        # Skip Policy.__init__, which needs the assignment and form question sheets; _flush_all only needs the roster.
+        policy = Policy.__new__(Policy)
+        policy.sheet_records = sheet
+
+        new = StudentRecord.from_email(email="c@berkeley.edu", sheet_records=sheet)
+        new.queue_write_back(col_key="hw1", col_value=1)
+        first = StudentRecord.from_email(email="a@berkeley.edu", sheet_records=sheet)
+        first.queue_write_back(col_key="hw1", col_value=2)
+        second = StudentRecord.from_email(email="b@berkeley.edu", sheet_records=sheet)
+        second.queue_write_back(col_key="approval_status", col_value="Pending")
+        second.queue_write_back(col_key="hw1", col_value=3)
+
+        policy._flush_all(new, first, second)
+
+        # The new record is appended on its own...
+        assert worksheet.appended_rows == [["c@berkeley.edu", None, 1]]
+
+        # ...and both existing rows are written in a single batch update, one range per row.
+        assert worksheet.spreadsheet.batch_updates == [
+            {
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {"range": "'Roster'!C2:C2", "values": [[2]]},
+                    {"range": "'Roster'!B3:C3", "values": [["Pending", 3]]},
+                ],
+            }
+        ]
+
+        for record in [new, first, second]:
+            assert record.write_queue == {}
+        assert new.table_record["hw1"] == 1
+        assert first.table_record["hw1"] == 2
+        assert second.table_record["approval_status"] == "Pending"
+        assert second.get_request("hw1") == 3
@@ -0,0 +1,30 @@
+import pytest
+from src.errors import StudentRecordError
+from src.record import StudentRecord
+
+from tests.MockSheet import MockSheet
+
+
+class TestStudentRecord:
+    def get_record(self, value) -> StudentRecord:
+        headers = ["email", "hw1"]
+        sheet = MockSheet(rows=[], headers=headers, sheet=None)
+        return StudentRecord(table_record={"email": "a@berkeley.edu", "hw1": value}, table_index=0, sheet=sheet)
+
+    def test_get_request_numeric(self):
+        assert self.get_record(3).get_request("hw1") == 3
+        assert self.get_record(3.0).get_request("hw1") == 3
+
+    def test_get_request_string(self):
+        assert self.get_record("  4 ").get_request("hw1") == 4
+        assert self.get_record("").get_request("hw1") is None
+
+    def test_get_request_invalid(self):
+        with pytest.raises(StudentRecordError):
+            self.get_record(2.5).get_request("hw1")
+        with pytest.raises(StudentRecordError):
+            self.get_record("x").get_request("hw1")
+
+    def test_get_request_missing_column(self):
+        with pytest.raises(StudentRecordError):
+            self.get_record(1).get_request("hw2")
@@ -0,0 +1,44 @@
+from src.sheets import Sheet
+
+from tests.MockWorksheet import MockWorksheet
+
+
+class TestSheet:
+    def get_sheet(self) -> Sheet:
+        return Sheet(
+            sheet=MockWorksheet(
+                [["email", "hw1"], ["A@berkeley.edu", "1"], ["b@berkeley.edu", "2"], ["a@berkeley.edu", "3"]]
+            )
+        )
+
+    def test_get_record_by_id_case_insensitive(self):
+        sheet = self.get_sheet()
+        assert sheet.get_row_index_by(id_column="email", id_value="B@Berkeley.edu") == 1
+        assert sheet.get_record_by_id(id_column="email", id_value="c@berkeley.edu") is None
+
+    def test_get_record_by_id_first_duplicate_wins(self):
+        sheet = self.get_sheet()
+        assert sheet.get_record_by_id(id_column="email", id_value="a@berkeley.edu") == (
+            0,
+            {"email": "A@berkeley.edu", "hw1": "1"},
+        )
+
+    def test_append_row_resets_index(self):
+        sheet = self.get_sheet()
+        assert sheet.get_row_index_by(id_column="email", id_value="a@berkeley.edu") == 0
+        assert sheet.row_index != {}
+        sheet.append_row(values=["c@berkeley.edu", "4"], value_input_option="USER_ENTERED")
+        assert sheet.row_index == {}
+
+    def test_batch_update_rows(self):
+        sheet = self.get_sheet()
+        sheet.batch_update_rows(updates=[(0, {1: "5"}), (2, {0: "c@berkeley.edu", 1: "6"}), (1, {})])
+        assert sheet.sheet.spreadsheet.batch_updates == [
+            {
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {"range": "'Roster'!B2:B2", "values": [["5"]]},
+                    {"range": "'Roster'!A4:B4", "values": [["c@berkeley.edu", "6"]]},
+                ],
+            }
+        ]